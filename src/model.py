@@ -1,10 +1,12 @@
 #!/usr/bin/python3
 
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import List, Optional, Tuple
 
 
 class Position:
+    __slots__ = ("x", "y")
+
     def __init__(self, x: int, y: int):
         assert x != 0 and y != 0
         self.x = x
@@ -18,22 +20,24 @@ class Position:
         self.y += y
 
     def addTuple(self, v: Tuple[int, int]):
-        assert isinstance(v, tuple) and len(v) == 2
         self.add(v[0], v[1])
 
 
-class Symbol(Enum):
+class Symbol(IntEnum):
     BLANK = 0
     CROSS = 1
     NOUGHT = 2
 
 
-def invertTeam(sym: Symbol):
-    if sym == Symbol.CROSS:
-        return Symbol.NOUGHT
-    if sym == Symbol.NOUGHT:
-        return Symbol.CROSS
-    return sym
+# Plain int for hot paths, compared without looking up a Symbol member
+BLANK = Symbol.BLANK.value
+
+
+_invertedTeams = (Symbol.BLANK, Symbol.NOUGHT, Symbol.CROSS)
+
+
+def invertTeam(sym: Symbol) -> Symbol:
+    return _invertedTeams[sym]
 
 
 class MoveError(Enum):
@@ -52,81 +56,167 @@ class Player:
 
 
 class Board:
-    __quartersCount = 4
-    BoardPosition = (int, int, int)
+    BoardPosition = (int, int)
+    __mask64 = (1 << 64) - 1
+    # Per symbol, maps repr bytes to "1" where the cell holds that symbol
+    __bitDigits = [
+        bytes.maketrans(
+            bytes(Symbol), bytes(ord("1" if s == sym else "0") for s in Symbol)
+        )
+        for sym in Symbol
+    ]
 
     def __init__(self, radius: int):
         assert radius > 0
-        self.repr: List[List[List[Symbol]]] = [
-            [[Symbol.BLANK for _ in range(radius)] for _ in range(radius)]
-            for _ in range(Board.__quartersCount)
-        ]
-        self.__hash = 0
+        self.__radius = radius
+        # One byte per cell of a single (2 * radius) x (2 * radius) grid, row by
+        # row. There is no zero coordinate, so -1 and 1 are neighbouring cells.
+        self.repr = Board.__blankRepr(radius)
+        # XOR of Board.__zobristKey over the non-blank cells
+        self._hash = 0
+        # Same as _hash, for each of the other 7 rotations and reflections
+        self.__symmetricHashes = [0] * 7
+
+    @staticmethod
+    def __blankRepr(radius: int) -> bytearray:
+        return bytearray([Symbol.BLANK]) * (2 * radius) ** 2
+
+    """
+    Zobrist key of sym at (x, y): splitmix64 of the cell and symbol, so equal
+    positions hash the same on every board whatever its radius or history.
+    \pre: |x|, |y| < 2 ** 30, sym != BLANK
+    """
+
+    @staticmethod
+    def __zobristKey(x: int, y: int, sym: int) -> int:
+        mask = Board.__mask64
+        z = (x & 0x7FFFFFFF) << 33 | (y & 0x7FFFFFFF) << 2 | sym
+        z = (z + 0x9E3779B97F4A7C15) & mask
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+        return z ^ (z >> 31)
 
     def getRadius(self):
-        return len(self.repr[0])
+        return self.__radius
 
     """
     \pre: pos = (x, y), x != 0, y != 0
     """
 
-    def getReprIndex(pos: Position) -> "Optional[Board.BoardPosition]":
-        if pos.x > 0 and pos.y > 0:
-            quarter = 1
-        elif pos.x < 0 and pos.y > 0:
-            quarter = 2
-        elif pos.x < 0 and pos.y < 0:
-            quarter = 3
-        elif pos.x > 0 and pos.y < 0:
-            quarter = 4
-        else:
-            return None
-        return (quarter, abs(pos.x) - 1, abs(pos.y) - 1)
+    def getReprIndex(self, pos: Position) -> "Board.BoardPosition":
+        radius = self.__radius
+        return (pos.y + radius - (pos.y > 0), pos.x + radius - (pos.x > 0))
+
+    """
+    Same as getReprIndex, flattened into an index of repr
+    \pre: pos = (x, y), x != 0, y != 0
+    """
+
+    def getReprOffset(self, pos: Position) -> int:
+        row, col = self.getReprIndex(pos)
+        return row * 2 * self.__radius + col
 
     """
     \pre: radius > getRadius()
     """
 
     def increaseRadius(self, radius: int):
-        oldRadius = self.getRadius()
+        oldRadius = self.__radius
         if oldRadius >= radius:
             return
-        difference = radius - oldRadius
-        for q in range(Board.__quartersCount):
-            for i in range(oldRadius):
-                for _ in range(difference):
-                    self.repr[q][i].append(Symbol.BLANK)
-            for _ in range(difference):
-                self.repr[q].append([Symbol.BLANK for _ in range(radius)])
+        oldSide, side = 2 * oldRadius, 2 * radius
+        shift = radius - oldRadius
+        oldRepr = self.repr
+        newRepr = Board.__blankRepr(radius)
+        for row in range(oldSide):
+            src = row * oldSide
+            dst = (row + shift) * side + shift
+            newRepr[dst : dst + oldSide] = oldRepr[src : src + oldSide]
+        self.__radius = radius
+        self.repr = newRepr
 
-    @staticmethod
-    def hashForPos(pos: "Board.BoardPosition", sym: Symbol):
-        return sym * (pos[0] ** 2) * pos[1] * pos[2]
+    """
+    Grows the board first if pos doesn't fit
+    """
 
     def setSymbol(self, pos: Position, sym: Symbol):
-        q, i, j = self.getReprIndex(pos)
-        oldSym = self.repr[q][i][j]
-        self._hash ^= Board.hashForPos((q, i, j), oldSym)
-        self._hash ^= Board.hashForPos((q, i, j), sym)
-        self.repr[q][i][j] = sym
+        self.setSymbolAt(self.locate(pos), sym)
+
+    """
+    \pre: offset = getReprOffset(pos) for a pos that fits
+    """
+
+    def setSymbolAt(self, offset: int, sym: Symbol):
+        oldSym = self.repr[offset]
+        if oldSym != sym:
+            radius = self.__radius
+            row, col = divmod(offset, 2 * radius)
+            x, y = col - radius + (col >= radius), row - radius + (row >= radius)
+            if oldSym != BLANK:
+                self.__toggleKeys(x, y, oldSym)
+            if sym != BLANK:
+                self.__toggleKeys(x, y, sym)
+        self.repr[offset] = sym
+
+    def __toggleKeys(self, x: int, y: int, sym: int):
+        key = Board.__zobristKey
+        self._hash ^= key(x, y, sym)
+        hashes = self.__symmetricHashes
+        hashes[0] ^= key(-x, y, sym)
+        hashes[1] ^= key(x, -y, sym)
+        hashes[2] ^= key(-x, -y, sym)
+        hashes[3] ^= key(y, x, sym)
+        hashes[4] ^= key(-y, x, sym)
+        hashes[5] ^= key(y, -x, sym)
+        hashes[6] ^= key(-y, -x, sym)
+
+    """
+    Bit (row * 2 * getRadius() + col) is set iff that cell of repr holds sym.
+    Built from repr on every call, O(cells).
+    """
+
+    def getBitboard(self, sym: Symbol) -> int:
+        # Bit 0 is the first cell, so the binary digits go in reverse order
+        return int(self.repr[::-1].translate(Board.__bitDigits[sym]), 2)
 
     def getSymbol(self, pos: Position) -> Optional[Symbol]:
         if not self.fits(pos):
             return None
-        q, i, j = self.getReprIndex(pos)
-        return self.repr[q][i][j]
+        return Symbol(self.repr[self.getReprOffset(pos)])
 
     def posDifference(self, pos: Position) -> int:
-        return max(0, max(abs(pos.x), abs(pos.y)) - self.getRadius())
+        return max(0, abs(pos.x) - self.__radius, abs(pos.y) - self.__radius)
 
     def fits(self, pos: Position):
-        return self.posDifference(pos) > 0
+        radius = self.__radius
+        return -radius <= pos.x <= radius and -radius <= pos.y <= radius
 
     def makeFit(self, pos: Position):
-        self.increaseRadius(self.getRadius() + self.posDifference(pos))
+        self.locate(pos)
+
+    """
+    makeFit(pos), then getReprOffset(pos)
+    """
+
+    def locate(self, pos: Position) -> int:
+        radius = self.__radius
+        reach = max(abs(pos.x), abs(pos.y))
+        if reach > radius:
+            # At least double, so that drifting outwards move by move doesn't
+            # copy the whole board every time
+            self.increaseRadius(max(reach, 2 * radius))
+        return self.getReprOffset(pos)
 
     def hash(self) -> int:
-        return self.__hash
+        return self._hash
+
+    """
+    Same for all 8 rotations and reflections of the position around the origin,
+    on any board radius, like hash()
+    """
+
+    def canonicalHash(self) -> int:
+        return min(self._hash, *self.__symmetricHashes)
 
 
 class Game:
@@ -141,15 +231,30 @@ class Game:
         return Board(initRadius)
 
     def makeMove(self, pos: Position, sym: Symbol) -> MoveError:
-        if self.status is not Symbol.BLANK:
+        if self.status != BLANK:
             return MoveError.GAME_ALREADY_OVER
+        if sym == BLANK:
+            return MoveError.WRONG_SYMBOL
         if self.curTeam != sym:
             return MoveError.WRONG_TEAM
-        self.board.makeFit(pos)
-        if self.board.getSymbol(pos) != Symbol.BLANK:
+        board = self.board
+        offset = board.locate(pos)
+        if board.repr[offset] != BLANK:
             return MoveError.WRONG_PLACE
-        if sym == Symbol.BLANK:
-            return MoveError.WRONG_SYMBOL
-        self.curTeam = invertTeam(self.curTeam)
-        self.board.setSymbol(pos, sym)
+        self.curTeam = invertTeam(sym)
+        board.setSymbolAt(offset, sym)
         return MoveError.SUCCESS
+
+    """
+    Takes back the last move made, which was at pos. The board keeps its radius.
+    \pre: pos holds the symbol of the last successful makeMove
+    """
+
+    def unmakeMove(self, pos: Position):
+        board = self.board
+        offset = board.getReprOffset(pos)
+        sym = board.repr[offset]
+        assert sym != BLANK
+        board.setSymbolAt(offset, BLANK)
+        self.curTeam = Symbol(sym)
+        self.status = Symbol.BLANK
@@ -1,51 +1,63 @@
+from functools import lru_cache
 from typing import Tuple
 
 from model import *
 
+"""
+(bit step to the next cell of a line, cells a line may start at) for every
+direction on a side x side bitboard
+"""
+
+
+@lru_cache(maxsize=16)
+def winLines(side: int, winCount: int) -> Tuple[Tuple[int, int], ...]:
+    # Runs must not wrap from the end of one row to the start of the next
+    everyRow = ((1 << side * side) - 1) // ((1 << side) - 1)
+    fromLeft = ((1 << max(0, side - winCount + 1)) - 1) * everyRow
+    fromRight = fromLeft << (winCount - 1)
+    return ((1, fromLeft), (side, -1), (side + 1, fromLeft), (side - 1, fromRight))
+
 
 class ServerBoard(Board):
+    winCount = 5
+
     def checkStatus(self) -> Symbol:
-        Vec2 = Tuple[int, int]
+        n = ServerBoard.winCount
+        lines = winLines(2 * self.getRadius(), n)
+        for sym in (Symbol.CROSS, Symbol.NOUGHT):
+            bits = self.getBitboard(sym)
+            for step, starts in lines:
+                run = bits & starts
+                for k in range(1, n):
+                    run &= bits >> (k * step)
+                if run:
+                    return sym
+        return Symbol.BLANK
 
-        def orientedPass(
-            board: Board,
-            innerStep: Vec2,
-            outerStep: Vec2,
-            symbol: Symbol,
-            winCount: int,
-            start: Position,
-        ) -> bool:
-            while board.fits(start):
-                cur = start.clone()
-                cnt = 0
-                while board.fits(cur):
-                    if board.getSymbol(cur) == symbol:
-                        cnt += 1
-                    else:
-                        cnt = 0
-                    if cnt >= winCount:
-                        return True
-                    cur.addTuple(innerStep)
-                start.addTuple(outerStep)
-            return False
+    """
+    Only looks at lines through pos, so it's enough right after sym was put
+    there. checkStatus scans the whole board.
+    """
 
-        winCount = 5
-        r = self.getRadius()
-        stepTriples = [
-            ((1, 0), (0, -1), Position(-r, r)),
-            ((0, -1), (1, 0), Position(-r, r)),
-            ((-1, -1), (1, 0), Position(-r, r)),
-            ((1, -1), (-1, 0), Position(r, r)),
-        ]
-        for triple in stepTriples:
-            if orientedPass(
-                self, triple[0], triple[1], Symbol.CROSS, winCount, triple[2]
-            ):
-                return Symbol.CROSS
-            if orientedPass(
-                self, triple[0], triple[1], Symbol.NOUGHT, winCount, triple[2]
-            ):
-                return Symbol.NOUGHT
+    def checkStatusAt(self, pos: Position, sym: Symbol) -> Symbol:
+        side = 2 * self.getRadius()
+        n = ServerBoard.winCount
+        cells = self.repr
+        row, col = self.getReprIndex(pos)
+        for dRow, dCol in ((0, 1), (1, 0), (1, 1), (1, -1)):
+            count = 1
+            for dr, dc in ((dRow, dCol), (-dRow, -dCol)):
+                r, c = row + dr, col + dc
+                while (
+                    count < n
+                    and 0 <= r < side
+                    and 0 <= c < side
+                    and cells[r * side + c] == sym
+                ):
+                    count += 1
+                    r, c = r + dr, c + dc
+            if count >= n:
+                return sym
         return Symbol.BLANK
 
 
@@ -60,5 +72,5 @@ class ServerGame(Game):
     def makeMove(self, pos: Position, sym: Symbol) -> MoveError:
         err = super().makeMove(pos, sym)
         if err is MoveError.SUCCESS:
-            self.status = self.board.checkStatus()
+            self.status = self.board.checkStatusAt(pos, sym)
         return err
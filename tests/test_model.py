@@ -0,0 +1,121 @@
+import sys
+import unittest
+
+from pathlib import Path
+
+sys.path.insert(1, (Path(__file__).absolute().parent.parent / "src").as_posix())
+
+from model import Board, Game, MoveError, Position, Symbol
+
+
+class BoardTest(unittest.TestCase):
+    def testGetSymbolInsideBoard(self):
+        board = Board(2)
+        board.setSymbol(Position(-2, 2), Symbol.NOUGHT)
+        self.assertEqual(board.getSymbol(Position(-2, 2)), Symbol.NOUGHT)
+        self.assertEqual(board.getSymbol(Position(1, 1)), Symbol.BLANK)
+
+    def testGetSymbolOutsideBoard(self):
+        board = Board(2)
+        self.assertIsNone(board.getSymbol(Position(3, 1)))
+        self.assertIsNone(board.getSymbol(Position(1, -3)))
+
+    def testSetSymbolOutsideBoard(self):
+        board, reference = Board(2), Board(4)
+        for pos in (Position(3, 1), Position(1, -3)):
+            board.setSymbol(pos, Symbol.CROSS)
+            reference.setSymbol(pos, Symbol.CROSS)
+        self.assertEqual(board.getSymbol(Position(3, 1)), Symbol.CROSS)
+        self.assertEqual(board.getSymbol(Position(1, -3)), Symbol.CROSS)
+        self.assertEqual(board.getSymbol(Position(-2, 2)), Symbol.BLANK)
+        self.assertEqual(board.getSymbol(Position(1, 2)), Symbol.BLANK)
+        self.assertEqual(board.hash(), reference.hash())
+
+    def testGrowsAtLeastTwice(self):
+        board = Board(2)
+        board.makeFit(Position(1, 1))
+        self.assertEqual(board.getRadius(), 2)
+        board.makeFit(Position(3, 1))
+        self.assertEqual(board.getRadius(), 4)
+        board.makeFit(Position(-1, -20))
+        self.assertEqual(board.getRadius(), 20)
+
+    def testCanonicalHashOfSymmetricBoards(self):
+        moves = [((1, 2), Symbol.CROSS), ((-3, 1), Symbol.NOUGHT)]
+        symmetries = [
+            lambda x, y: (x, y),
+            lambda x, y: (-x, y),
+            lambda x, y: (x, -y),
+            lambda x, y: (-x, -y),
+            lambda x, y: (y, x),
+            lambda x, y: (-y, x),
+            lambda x, y: (y, -x),
+            lambda x, y: (-y, -x),
+        ]
+        hashes = set()
+        for symmetry in symmetries:
+            board = Board(3)
+            for (x, y), sym in moves:
+                board.setSymbol(Position(*symmetry(x, y)), sym)
+            hashes.add(board.canonicalHash())
+        self.assertEqual(len(hashes), 1)
+
+        other = Board(3)
+        other.setSymbol(Position(1, 3), Symbol.CROSS)
+        self.assertNotIn(other.canonicalHash(), hashes)
+
+    def testCanonicalHashIgnoresRadius(self):
+        small, large = Board(3), Board(6)
+        for board in (small, large):
+            board.setSymbol(Position(1, 1), Symbol.CROSS)
+        self.assertEqual(small.canonicalHash(), large.canonicalHash())
+
+        before = small.canonicalHash()
+        small.increaseRadius(10)
+        self.assertEqual(small.canonicalHash(), before)
+
+    def testEqualPositionsHashEqual(self):
+        fresh, grown = Board(3), Board(1)
+        grown.increaseRadius(3)
+        for board in (fresh, grown):
+            board.setSymbol(Position(1, 1), Symbol.CROSS)
+            board.setSymbol(Position(-3, 2), Symbol.NOUGHT)
+        self.assertEqual(fresh.hash(), grown.hash())
+        self.assertNotEqual(fresh.hash(), 0)
+
+        grown.setSymbol(Position(1, 1), Symbol.BLANK)
+        grown.setSymbol(Position(-3, 2), Symbol.BLANK)
+        self.assertEqual(grown.hash(), 0)
+
+
+class GameTest(unittest.TestCase):
+    def testBlankMoveIsWrongSymbol(self):
+        game = Game([], 2)
+        self.assertIs(
+            game.makeMove(Position(1, 1), Symbol.BLANK), MoveError.WRONG_SYMBOL
+        )
+        self.assertIs(
+            game.makeMove(Position(1, 1), Symbol.NOUGHT), MoveError.WRONG_TEAM
+        )
+        self.assertEqual(game.board.getSymbol(Position(1, 1)), Symbol.BLANK)
+
+    def testUnmakeMoveRestoresState(self):
+        game = Game([], 2)
+        game.makeMove(Position(1, 1), Symbol.CROSS)
+        hashBefore = game.board.hash()
+        self.assertIs(game.makeMove(Position(-4, 2), Symbol.NOUGHT), MoveError.SUCCESS)
+        self.assertNotEqual(game.board.hash(), hashBefore)
+
+        game.unmakeMove(Position(-4, 2))
+        self.assertEqual(game.board.hash(), hashBefore)
+        self.assertIs(game.curTeam, Symbol.NOUGHT)
+        self.assertIs(game.status, Symbol.BLANK)
+        self.assertEqual(game.board.getSymbol(Position(-4, 2)), Symbol.BLANK)
+
+        game.unmakeMove(Position(1, 1))
+        self.assertEqual(game.board.hash(), 0)
+        self.assertIs(game.curTeam, Symbol.CROSS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import sys
+import unittest
+
+from pathlib import Path
+
+src = Path(__file__).absolute().parent.parent / "src"
+sys.path.insert(1, src.as_posix())
+sys.path.insert(1, (src / "server").as_posix())
+
+from model import MoveError, Position, Symbol
+from server import ServerGame
+
+
+class ServerGameTest(unittest.TestCase):
+    def testWinAcrossZeroAxis(self):
+        game = ServerGame([], 2)
+        for x in (-2, -1, 1, 2):
+            self.assertIs(
+                game.makeMove(Position(x, 1), Symbol.CROSS), MoveError.SUCCESS
+            )
+            self.assertEqual(game.status, Symbol.BLANK)
+            game.makeMove(Position(x, 3), Symbol.NOUGHT)
+        self.assertIs(game.makeMove(Position(3, 1), Symbol.CROSS), MoveError.SUCCESS)
+        self.assertEqual(game.status, Symbol.CROSS)
+        self.assertEqual(game.board.checkStatus(), Symbol.CROSS)
+
+    def testNoWinWithGap(self):
+        game = ServerGame([], 3)
+        for x in (-3, -2, -1, 2, 3):
+            game.makeMove(Position(x, -1), Symbol.CROSS)
+            game.makeMove(Position(x, 2), Symbol.NOUGHT)
+        self.assertEqual(game.status, Symbol.BLANK)
+        self.assertEqual(game.board.checkStatus(), Symbol.BLANK)
+
+
+if __name__ == "__main__":
+    unittest.main()